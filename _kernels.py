@@ -0,0 +1,48 @@
+"""Счётные ядра формул затраченных калорий.
+
+Формулы вынесены из методов классов в свободные функции над
+числами с плавающей точкой. Реализация выбирается по убыванию
+скорости запуска и исполнения: собранное заранее расширение
+kernels (Cython, см. kernels.pyx и setup.py) загружается без
+прогрева JIT; иначе при установленном Numba функции
+компилируются через @njit (cache=True убирает повторную
+JIT-компиляцию между запусками); без того и другого остаётся
+чистый Python. Константы классов вписаны в формулы литералами,
+чтобы компилятор мог свернуть их заранее. fastmath намеренно
+не включён: он разрешает перестановку операций и ломает
+побитовое совпадение с эталонными формулами.
+"""
+
+try:
+    from kernels import run_cal, swm_cal, wlk_cal  # noqa: F401
+except ImportError:
+    try:
+        from numba import njit
+    except ImportError:
+        def njit(*args, **kwargs):
+            """Заглушка декоратора на случай отсутствия Numba."""
+            def decorator(func):
+                return func
+            return decorator
+
+    @njit(cache=True)
+    def run_cal(action: float, duration: float, weight: float) -> float:
+        """Затраченные калории для бега."""
+        return ((18.0 * action * 0.65 / (1000.0 * duration) - 20.0)
+                * weight * duration * 60.0 / 1000.0)
+
+    @njit(cache=True)
+    def wlk_cal(action: float, duration: float,
+                weight: float, height: float) -> float:
+        """Затраченные калории для спортивной ходьбы."""
+        speed = action * 0.65 / (1000.0 * duration)
+        return ((0.035 * weight
+                + (speed * speed // height) * 0.029 * weight)
+                * duration * 60.0)
+
+    @njit(cache=True)
+    def swm_cal(length_pool: float, count_pool: float,
+                duration: float, weight: float) -> float:
+        """Затраченные калории для плавания."""
+        return ((length_pool * count_pool / (1000.0 * duration) + 1.1)
+                * 2.0 * weight)
@@ -0,0 +1,184 @@
+"""Векторная обработка пакетов тренировок на NumPy.
+
+Модуль дополняет объектный интерфейс из homework.py: вместо
+создания объекта Training на каждый пакет входные данные
+группируются по типу тренировки и раскладываются в массивы
+столбцов (structure-of-arrays). Вся арифметика выполняется
+целыми столбцами без создания промежуточных объектов Python.
+"""
+
+import sys
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from homework import Running, SportsWalking, Swimming, Training
+
+Package = Tuple[str, List[Union[int, float]]]
+
+WORKOUT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'SWM': ('action', 'duration', 'weight', 'length_pool', 'count_pool'),
+    'RUN': ('action', 'duration', 'weight'),
+    'WLK': ('action', 'duration', 'weight', 'height'),
+}
+
+WORKOUT_NAMES: Dict[str, str] = {
+    'SWM': 'Swimming',
+    'RUN': 'Running',
+    'WLK': 'SportsWalking',
+}
+
+WORKOUT_LEN_STEP: Dict[str, float] = {
+    'SWM': Swimming.LEN_STEP,
+    'RUN': Running.LEN_STEP,
+    'WLK': SportsWalking.LEN_STEP,
+}
+
+
+def read_packages(batch: List[Package]) -> Dict[str, np.recarray]:
+    """Сгруппировать пакеты по типу тренировки в массивы столбцов."""
+    buckets: Dict[str, List[List[Union[int, float]]]] = {
+        workout_type: [] for workout_type in WORKOUT_FIELDS
+    }
+    for workout_type, data in batch:
+        if workout_type not in buckets:
+            raise ValueError(f'{workout_type} is inappropriate value '
+                             f'for training type. Check WORKOUT_FIELDS '
+                             f'in batch module.')
+        buckets[workout_type].append(data)
+    records: Dict[str, np.recarray] = {}
+    for workout_type, rows in buckets.items():
+        if not rows:
+            continue
+        columns = np.asarray(rows, dtype=np.float64).T
+        records[workout_type] = np.rec.fromarrays(
+            columns, names=list(WORKOUT_FIELDS[workout_type])
+        )
+    return records
+
+
+def get_distance(action: np.ndarray, len_step: float) -> np.ndarray:
+    """Получить дистанции в км для столбца показаний датчика."""
+    return action * len_step / Training.M_IN_KM
+
+
+def get_mean_speed(distance: np.ndarray,
+                   duration: np.ndarray) -> np.ndarray:
+    """Получить средние скорости движения для столбца дистанций."""
+    return distance / duration
+
+
+def running_calories(action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray) -> np.ndarray:
+    """Получить затраченные калории для столбца пробежек."""
+    speed = get_mean_speed(get_distance(action, Running.LEN_STEP), duration)
+    return ((Running.COEFF_CALORIE_RUN_1 * speed
+            - Running.COEFF_CALORIE_RUN_2)
+            * weight / Training.M_IN_KM
+            * (duration * Training.M_IN_HOUR))
+
+
+def walking_calories(action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray,
+                     height: np.ndarray) -> np.ndarray:
+    """Получить затраченные калории для столбца прогулок."""
+    speed = get_mean_speed(
+        get_distance(action, SportsWalking.LEN_STEP), duration
+    )
+    return ((SportsWalking.COEFF_CALORIE_WLK_1 * weight
+            + np.floor_divide(speed * speed, height)
+            * SportsWalking.COEFF_CALORIE_WLK_2 * weight)
+            * (duration * Training.M_IN_HOUR))
+
+
+def swimming_calories(length_pool: np.ndarray,
+                      count_pool: np.ndarray,
+                      duration: np.ndarray,
+                      weight: np.ndarray) -> np.ndarray:
+    """Получить затраченные калории для столбца заплывов."""
+    speed = (length_pool * count_pool / Training.M_IN_KM / duration)
+    return ((speed + Swimming.COEFF_CALORIE_SWM_1)
+            * Swimming.COEFF_CALORIE_SWM_2 * weight)
+
+
+def format_batch(types: List[str],
+                 durations: np.ndarray,
+                 distances: np.ndarray,
+                 speeds: np.ndarray,
+                 calories: np.ndarray) -> List[str]:
+    """Отформатировать сообщения для уже посчитанных столбцов.
+
+    tolist() переводит каждый столбец в числа Python одним
+    проходом на C, после чего остаётся только цикл форматирования.
+    """
+    return [
+        f'Тип тренировки: {training_type}; '
+        f'Длительность: {duration:.3f} ч.; '
+        f'Дистанция: {distance:.3f} км; '
+        f'Ср. скорость: {speed:.3f} км/ч; '
+        f'Потрачено ккал: {spent:.3f}.'
+        for training_type, duration, distance, speed, spent
+        in zip(types, durations.tolist(), distances.tolist(),
+               speeds.tolist(), calories.tolist())
+    ]
+
+
+def _calories_for(workout_type: str, records: np.recarray) -> np.ndarray:
+    """Посчитать калории для одного типа тренировки."""
+    if workout_type == 'RUN':
+        return running_calories(records.action,
+                                records.duration,
+                                records.weight)
+    if workout_type == 'WLK':
+        return walking_calories(records.action,
+                                records.duration,
+                                records.weight,
+                                records.height)
+    return swimming_calories(records.length_pool,
+                             records.count_pool,
+                             records.duration,
+                             records.weight)
+
+
+def compute_messages(records_by_type: Dict[str, np.recarray]) -> List[str]:
+    """Посчитать и отформатировать сообщения для сгруппированных данных."""
+    messages: List[str] = []
+    for workout_type, records in records_by_type.items():
+        distances = get_distance(records.action,
+                                 WORKOUT_LEN_STEP[workout_type])
+        if workout_type == 'SWM':
+            speeds = (records.length_pool * records.count_pool
+                      / Training.M_IN_KM / records.duration)
+        else:
+            speeds = get_mean_speed(distances, records.duration)
+        spent = _calories_for(workout_type, records)
+        messages.extend(format_batch(
+            [WORKOUT_NAMES[workout_type]] * len(records),
+            records.duration, distances, speeds, spent,
+        ))
+    return messages
+
+
+def process_packages(batch: List[Package]) -> List[str]:
+    """Обработать пакет данных целиком и вернуть строки сообщений."""
+    return compute_messages(read_packages(batch))
+
+
+def main_batch(records_by_type: Dict[str, np.recarray]) -> None:
+    """Вывести сообщения для всего пакета одной записью в stdout."""
+    messages = compute_messages(records_by_type)
+    sys.stdout.write('\n'.join(messages))
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+    ]
+
+    main_batch(read_packages(packages))
@@ -1,15 +1,17 @@
-from abc import ABCMeta
-from abc import abstractmethod
-from dataclasses import asdict
-from dataclasses import dataclass
-from typing import Dict
-from typing import List
-from typing import Type
-from typing import Union
-
-
-@dataclass
-class InfoMessage:
+import sys
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+from _kernels import run_cal, swm_cal, wlk_cal
+
+_TEXT_MESSAGE: str = ('Тип тренировки: %s; '
+                      'Длительность: %.3f ч.; '
+                      'Дистанция: %.3f км; '
+                      'Ср. скорость: %.3f км/ч; '
+                      'Потрачено ккал: %.3f.')
+
+
+class InfoMessage(NamedTuple):
     """Информационное сообщение о тренировке."""
     training_type: str
     duration: float
@@ -17,24 +19,17 @@ class InfoMessage:
     speed: float
     calories: float
 
-    TEXT_MESSAGE: str = ('Тип тренировки: {0}; '
-                         'Длительность: {1:.3f} ч.; '
-                         'Дистанция: {2:.3f} км; '
-                         'Ср. скорость: {3:.3f} км/ч; '
-                         'Потрачено ккал: {4:.3f}.')
-
     def get_message(self) -> str:
         """Возвращает строку сообщения."""
-        result_training_data = asdict(self)
-        return self.TEXT_MESSAGE.format(*result_training_data.values())
+        return _TEXT_MESSAGE % self
 
 
 class Training:
     """Базовый класс тренировки."""
+    TRAINING_TYPE: str = 'Training'
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
     M_IN_HOUR: int = 60
-    __metaclass__ = ABCMeta
 
     def __init__(self,
                  action: int,
@@ -45,15 +40,24 @@ class Training:
         self.duration = duration
         self.weight = weight
 
+    @cached_property
+    def distance(self) -> float:
+        """Дистанция в км, считается один раз на тренировку."""
+        return self.action * self.LEN_STEP / self.M_IN_KM
+
+    @cached_property
+    def mean_speed(self) -> float:
+        """Средняя скорость движения, считается один раз."""
+        return self.distance / self.duration
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        return self.distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration
+        return self.mean_speed
 
-    @abstractmethod
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
         raise NotImplementedError('Method get_spent_calories() '
@@ -61,7 +65,7 @@ class Training:
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(self.__class__.__name__,
+        return InfoMessage(self.TRAINING_TYPE,
                            self.duration,
                            self.get_distance(),
                            self.get_mean_speed(),
@@ -70,19 +74,18 @@ class Training:
 
 class Running(Training):
     """Тренировка: бег."""
+    TRAINING_TYPE: str = 'Running'
     COEFF_CALORIE_RUN_1: int = 18
     COEFF_CALORIE_RUN_2: int = 20
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.COEFF_CALORIE_RUN_1 * self.get_mean_speed()
-                - self.COEFF_CALORIE_RUN_2)
-                * self.weight / self.M_IN_KM
-                * (self.duration * self.M_IN_HOUR))
+        return run_cal(self.action, self.duration, self.weight)
 
 
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
+    TRAINING_TYPE: str = 'SportsWalking'
     COEFF_CALORIE_WLK_1: float = 0.035
     COEFF_CALORIE_WLK_2: float = 0.029
 
@@ -96,14 +99,13 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.COEFF_CALORIE_WLK_1 * self.weight
-                + (self.get_mean_speed() ** 2 // self.height)
-                * self.COEFF_CALORIE_WLK_2 * self.weight)
-                * (self.duration * self.M_IN_HOUR))
+        return wlk_cal(self.action, self.duration,
+                       self.weight, self.height)
 
 
 class Swimming(Training):
     """Тренировка: плавание."""
+    TRAINING_TYPE: str = 'Swimming'
     LEN_STEP: float = 1.38
     COEFF_CALORIE_SWM_1: float = 1.1
     COEFF_CALORIE_SWM_2: float = 2
@@ -117,33 +119,72 @@ class Swimming(Training):
         super().__init__(action, duration, weight)
         self.length_pool = length_pool
         self.count_pool = count_pool
+        self._total_km = length_pool * count_pool / self.M_IN_KM
 
-    def get_mean_speed(self) -> float:
-        """Получить среднюю скорость движения."""
-        return (self.length_pool
-                * self.count_pool
-                / self.M_IN_KM
-                / self.duration)
+    @cached_property
+    def mean_speed(self) -> float:
+        """Средняя скорость движения, считается один раз."""
+        return self._total_km / self.duration
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
-        return ((self.get_mean_speed()
-                + self.COEFF_CALORIE_SWM_1)
-                * self.COEFF_CALORIE_SWM_2
-                * self.weight)
+        return swm_cal(self.length_pool, self.count_pool,
+                       self.duration, self.weight)
 
 
 def read_package(workout_type: str, data: List[Union[int, float]]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    supported_workout_types: Dict[str, Type[Training]]
-    supported_workout_types = {'SWM': Swimming,
-                               'RUN': Running,
-                               'WLK': SportsWalking}
-    if workout_type in supported_workout_types:
-        return supported_workout_types[workout_type](*data)
+    if workout_type == 'SWM':
+        return Swimming(*data)
+    if workout_type == 'RUN':
+        return Running(*data)
+    if workout_type == 'WLK':
+        return SportsWalking(*data)
     raise ValueError(f'{workout_type} is inappropriate value '
-                     f'for training type. Check supported_workout_types '
-                     f'in read_package() function.')
+                     f'for training type. Supported types '
+                     f'are SWM, RUN and WLK.')
+
+
+_RUN, _WLK, _SWM = 0, 1, 2
+_KINDS: Dict[str, int] = {'RUN': _RUN, 'WLK': _WLK, 'SWM': _SWM}
+_NAMES = ('Running', 'SportsWalking', 'Swimming')
+
+
+def read_package_flat(workout_type: str,
+                      data: List[Union[int, float]],
+                      ) -> Tuple[int, Tuple[Union[int, float], ...]]:
+    """Прочитать данные датчиков без создания объекта тренировки."""
+    kind = _KINDS.get(workout_type)
+    if kind is None:
+        raise ValueError(f'{workout_type} is inappropriate value '
+                         f'for training type. Check _KINDS '
+                         f'at module level.')
+    return kind, tuple(data)
+
+
+def compute(kind: int,
+            data: Tuple[Union[int, float], ...]) -> InfoMessage:
+    """Посчитать показатели тренировки без объектов Training.
+
+    Быстрый путь для потоковой обработки: один переход по целому
+    коду тренировки вместо поиска методов по иерархии классов.
+    """
+    if kind == _RUN:
+        action, duration, weight = data
+        distance = action * 0.65 / 1000.0
+        speed = distance / duration
+        calories = run_cal(action, duration, weight)
+    elif kind == _WLK:
+        action, duration, weight, height = data
+        distance = action * 0.65 / 1000.0
+        speed = distance / duration
+        calories = wlk_cal(action, duration, weight, height)
+    else:
+        action, duration, weight, length_pool, count_pool = data
+        distance = action * 1.38 / 1000.0
+        speed = length_pool * count_pool / 1000.0 / duration
+        calories = swm_cal(length_pool, count_pool, duration, weight)
+    return InfoMessage(_NAMES[kind], duration, distance, speed, calories)
 
 
 def main(training: Training) -> None:
@@ -160,6 +201,9 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    messages = [read_package(workout_type, data)
+                .show_training_info()
+                .get_message()
+                for workout_type, data in packages]
+    sys.stdout.write('\n'.join(messages))
+    sys.stdout.write('\n')
@@ -0,0 +1,36 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""AOT-скомпилированные ядра формул затраченных калорий.
+
+Альтернатива Numba для окружений, где неприемлем прогрев JIT:
+модуль собирается заранее командой
+
+    python setup.py build_ext --inplace
+
+и подхватывается модулем _kernels вместо Python-версий формул.
+Формулы повторяют _kernels.py один в один; // заменено на
+floor(a / b), что для неотрицательных аргументов эквивалентно.
+"""
+
+from libc.math cimport floor
+
+
+def run_cal(double action, double duration, double weight):
+    """Затраченные калории для бега."""
+    return ((18.0 * action * 0.65 / (1000.0 * duration) - 20.0)
+            * weight * duration * 60.0 / 1000.0)
+
+
+def wlk_cal(double action, double duration,
+            double weight, double height):
+    """Затраченные калории для спортивной ходьбы."""
+    cdef double speed = action * 0.65 / (1000.0 * duration)
+    return ((0.035 * weight
+            + floor(speed * speed / height) * 0.029 * weight)
+            * duration * 60.0)
+
+
+def swm_cal(double length_pool, double count_pool,
+            double duration, double weight):
+    """Затраченные калории для плавания."""
+    return ((length_pool * count_pool / (1000.0 * duration) + 1.1)
+            * 2.0 * weight)
@@ -0,0 +1,15 @@
+"""Сборка AOT-ядра формул калорий: python setup.py build_ext --inplace."""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    extensions = []
+else:
+    extensions = cythonize([Extension('kernels', ['kernels.pyx'])])
+
+setup(
+    name='fitness-tracker-kernels',
+    ext_modules=extensions,
+)
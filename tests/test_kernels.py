@@ -0,0 +1,58 @@
+import math
+
+import pytest
+
+import _kernels
+
+
+def reference_run_cal(action, duration, weight):
+    speed = action * 0.65 / 1000 / duration
+    return (18 * speed - 20) * weight / 1000 * (duration * 60)
+
+
+def reference_wlk_cal(action, duration, weight, height):
+    speed = action * 0.65 / 1000 / duration
+    return ((0.035 * weight
+            + (speed ** 2 // height) * 0.029 * weight)
+            * (duration * 60))
+
+
+def reference_swm_cal(length_pool, count_pool, duration, weight):
+    speed = length_pool * count_pool / 1000 / duration
+    return (speed + 1.1) * 2 * weight
+
+
+@pytest.mark.parametrize('input_data', [
+    (9000, 1, 75),
+    (420, 4, 20),
+    (1206, 12, 6),
+])
+def test_run_cal_matches_reference(input_data):
+    assert math.isclose(_kernels.run_cal(*input_data),
+                        reference_run_cal(*input_data)), (
+        'Слитая формула run_cal должна совпадать с эталонной.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    (9000, 1, 75, 180),
+    (420, 4, 20, 42),
+    (1206, 12, 6, 12),
+])
+def test_wlk_cal_matches_reference(input_data):
+    assert math.isclose(_kernels.wlk_cal(*input_data),
+                        reference_wlk_cal(*input_data)), (
+        'Слитая формула wlk_cal должна совпадать с эталонной.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    (25, 40, 1, 80),
+    (42, 4, 4, 20),
+    (12, 6, 12, 6),
+])
+def test_swm_cal_matches_reference(input_data):
+    assert math.isclose(_kernels.swm_cal(*input_data),
+                        reference_swm_cal(*input_data)), (
+        'Слитая формула swm_cal должна совпадать с эталонной.'
+    )